@@ -172,12 +172,42 @@ options:
             - Only applicable when resource_type is 'extclient'
         required: false
         type: str
+    extclient_cache_ttl:
+        description:
+            - Seconds to reuse the external client list of a network across task invocations
+            - The list is cached in C(~/.ansible/tmp) with owner-only permissions and dropped on any change
+            - Set to 0 to disable the on-disk cache
+        required: false
+        type: int
+        default: 0
+    api_timeout:
+        description:
+            - Seconds to wait for the Netmaker API to answer a request; must be greater than 0
+            - Connecting to the API server is always limited to about 3 seconds
+            - Read timeouts are not retried; failed connects and 502/503/504 answers are retried up to 3 times
+        required: false
+        type: float
+        default: 30
+    token_cache:
+        description:
+            - Cache the bearer token obtained with username/password in C(~/.ansible/tmp) until shortly before it expires
+            - The cache file is owner-only, keyed on base_url and username, and stores a salted PBKDF2 verifier so a wrong password never reuses the token
+            - Disabled by default so bearer tokens are only written to disk on request, like C(extclient_cache_ttl)
+            - Ignored when master_key is used
+        required: false
+        type: bool
+        default: false
 requirements:
     - python >= 3.6
-    - requests
+    - urllib3
+    - orjson (optional, used for faster JSON encoding and decoding when installed)
 notes:
     - Either master_key or username/password must be provided
     - Master key authentication is recommended for automation
+    - All requests of a task, including authentication, reuse one keep-alive connection to the API server
+    - C(HTTPS_PROXY), C(HTTP_PROXY) and C(NO_PROXY) are honoured, e.g. when set through the task C(environment)
+    - Certificates are verified against the system trust store, or against C(REQUESTS_CA_BUNDLE) or C(CURL_CA_BUNDLE) when set
+    - With username/password and token_cache enabled, the bearer token is cached in C(~/.ansible/tmp)
     - Network-specific parameters are only used when resource_type is 'network'
     - External client parameters are only used when resource_type is 'extclient'
     - External clients are WireGuard devices that get config files without running netclient
@@ -260,78 +290,302 @@ msg:
     returned: always
 '''
 
+import base64
+import hashlib
+import hmac
 import json
+import os
+import socket
+import tempfile
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
+from urllib.request import getproxies, proxy_bypass
 
 try:
-    import requests
-    HAS_REQUESTS = True
+    import urllib3
+    from urllib3.util import connection as urllib3_connection
+    HAS_URLLIB3 = True
 except ImportError:
-    HAS_REQUESTS = False
-    REQUESTS_IMPORT_ERROR = traceback.format_exc()
+    HAS_URLLIB3 = False
+    URLLIB3_IMPORT_ERROR = traceback.format_exc()
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 
 
+def _install_dns_cache(host):
+    """Resolve the API host once and reuse the address for every new connection"""
+    if not host or getattr(urllib3_connection.create_connection, '_netmaker_host', None) == host:
+        return
+
+    try:
+        cached_ip = socket.gethostbyname(host)
+    except (socket.error, UnicodeError):
+        # Leave resolution to urllib3
+        return
+
+    original_create_connection = urllib3_connection.create_connection
+
+    def create_connection(address, *args, **kwargs):
+        conn_host, port = address
+        if conn_host == host:
+            try:
+                # Only the socket target changes; SNI and Host header still use the hostname
+                return original_create_connection((cached_ip, port), *args, **kwargs)
+            except ConnectionRefusedError:
+                # Fails fast, so a fresh lookup is cheap; timeouts are not retried here
+                pass
+        return original_create_connection(address, *args, **kwargs)
+
+    create_connection._netmaker_host = host
+    urllib3_connection.create_connection = create_connection
+
+
+# Cached tokens must stay valid at least this long to be reused
+_TOKEN_EXPIRY_MARGIN = 60
+
+_PASSWORD_VERIFIER_ITERATIONS = 100000
+
+
+def _token_cache_path(base_url, username):
+    """Path of the on-disk token cache for a server/user pair"""
+    digest = hashlib.blake2b(f"{base_url.rstrip('/')}|{username}".encode(), digest_size=16).hexdigest()
+    return os.path.join(os.path.expanduser('~/.ansible/tmp'), f"netmaker_token_{digest}.json")
+
+
+def _password_verifier(password, salt):
+    """Salted, slow hash used to check the password before reusing a cached token"""
+    return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, _PASSWORD_VERIFIER_ITERATIONS).hex()
+
+
+def _jwt_expiry(token):
+    """Read the exp claim from a JWT payload without verifying it"""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return int(_json_loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _load_cached_token(base_url, username, password):
+    """Return a cached token that is not about to expire, if the password matches"""
+    try:
+        with open(_token_cache_path(base_url, username), 'rb') as f:
+            cached = _json_loads(f.read())
+        if cached['expiry'] <= time.time() + _TOKEN_EXPIRY_MARGIN:
+            return None
+        # A wrong password must not ride on a token obtained with the right one
+        verifier = _password_verifier(password, bytes.fromhex(cached['salt']))
+        if hmac.compare_digest(verifier, cached['verifier']):
+            return cached['token']
+    except (OSError, KeyError, TypeError, ValueError):
+        pass
+    return None
+
+
+def _store_cached_token(base_url, username, password, token):
+    """Persist a token with its expiry so later task invocations skip authentication"""
+    expiry = _jwt_expiry(token)
+    if expiry is None:
+        return
+
+    path = _token_cache_path(base_url, username)
+    salt = os.urandom(16)
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # mkstemp creates a unique 0600 file, so a leftover from a crashed run can't block writes
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.netmaker_token_')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_json_dumps({
+                'token': token,
+                'expiry': expiry,
+                'salt': salt.hex(),
+                'verifier': _password_verifier(password, salt),
+            }))
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _authenticate_and_cache(api, base_url, username, password):
+    """Authenticate with username/password and cache the resulting token"""
+    # Drop any previous entry first so a failed attempt leaves no token behind
+    _discard_cached_token(base_url, username)
+    token = api.authenticate(username, password)
+    _store_cached_token(base_url, username, password, token)
+    return token
+
+
+def _discard_cached_token(base_url, username):
+    """Remove a cached token, e.g. after the server rejected it"""
+    try:
+        os.remove(_token_cache_path(base_url, username))
+    except OSError:
+        pass
+
+
+class NetmakerAPIError(Exception):
+    """API error response, carrying the HTTP status code"""
+
+    def __init__(self, msg, status):
+        super().__init__(msg)
+        self.status = status
+
+
 class NetmakerAPI:
     """Wrapper for Netmaker API operations"""
 
-    def __init__(self, base_url, token, validate_certs=True):
+    def __init__(self, base_url, token, validate_certs=True, extclient_cache_ttl=0, timeout=(3.05, 30)):
         self.base_url = base_url.rstrip('/')
+        proxy_url = self._proxy_for(self.base_url)
+        if not proxy_url:
+            # Behind a proxy the socket goes to the proxy, so resolving the API host is wasted
+            _install_dns_cache(urlparse(self.base_url).hostname)
         self.token = token
         self.validate_certs = validate_certs
+        # (connect, read) seconds; bounds how long one slow call can stall a run
+        self.timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
         self.headers = {
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
         }
 
+        # Reuse one connection pool so every call shares keep-alive connections;
+        # authentication and the API calls that follow ride the same TLS session
+        pool_kwargs = dict(
+            num_pools=1,
+            maxsize=20,
+            cert_reqs='CERT_REQUIRED' if validate_certs else 'CERT_NONE',
+            # read=0: a read timeout fails right away, so api_timeout bounds each call
+            retries=urllib3.Retry(total=3, read=0, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        )
+        ca_bundle = os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE')
+        if validate_certs and ca_bundle:
+            pool_kwargs['ca_cert_dir' if os.path.isdir(ca_bundle) else 'ca_certs'] = ca_bundle
+
+        if proxy_url:
+            proxy_auth = urllib3.util.parse_url(proxy_url).auth
+            if proxy_auth:
+                pool_kwargs['proxy_headers'] = urllib3.make_headers(proxy_basic_auth=proxy_auth)
+            self.http = urllib3.ProxyManager(proxy_url, **pool_kwargs)
+        else:
+            self.http = urllib3.PoolManager(**pool_kwargs)
+
+        # External client lists keyed by network ID, plus a clientid index per network
+        self._extclient_cache = {}
+        self._extclient_index = {}
+        self.extclient_cache_ttl = extclient_cache_ttl
+        # Node lists keyed by network ID
+        self._nodes_cache = {}
+
+    @staticmethod
+    def _proxy_for(url):
+        """Proxy URL from the environment for the given URL, or None if bypassed"""
+        parsed = urlparse(url)
+        if not parsed.hostname or proxy_bypass(parsed.hostname):
+            return None
+        proxy_url = getproxies().get(parsed.scheme)
+        # Accept bare host:port values, as requests does
+        if proxy_url and '://' not in proxy_url:
+            proxy_url = f"http://{proxy_url}"
+        return proxy_url
+
+    def set_token(self, token):
+        """Replace the bearer token used for subsequent requests"""
+        self.token = token
+        self.headers['Authorization'] = f'Bearer {token}'
+
+    def close(self):
+        """Release pooled connections"""
+        self.http.clear()
+
+    def _run_concurrently(self, calls, max_workers=8):
+        """Run independent API calls in parallel over the shared connection pool, preserving order"""
+        if len(calls) <= 1:
+            return [call() for call in calls]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def _has_body(response):
+        """Whether the response carries a body to decode (Content-Type is not trusted)"""
+        return response.headers.get('Content-Length') != '0' and bool(response.data)
+
+    @classmethod
+    def _error_body(cls, response):
+        """Decode a JSON error body, or None if it is missing or malformed"""
+        if not cls._has_body(response):
+            return None
+        try:
+            error_data = _json_loads(response.data)
+        except ValueError:
+            return None
+        return error_data if isinstance(error_data, dict) else None
+
     def _request(self, method, endpoint, data=None):
         """Make an API request"""
         url = f"{self.base_url}/api{endpoint}"
+        body = _json_dumps(data) if data is not None else None
+        # Deletes only need the status, so don't buffer their body up front
+        stream = method == 'DELETE'
 
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                json=data,
-                verify=self.validate_certs
+            response = self.http.request(
+                method, url, body=body, headers=self.headers, timeout=self.timeout,
+                preload_content=not stream
             )
+        except urllib3.exceptions.HTTPError as e:
+            raise Exception(f"API request failed: {str(e)}")
 
-            # Handle different response codes
-            if response.status_code == 404:
-                return None
-
-            if response.status_code == 204:  # No content (successful delete)
-                return True
-
-            # Netmaker returns 500 with "no result found" when resource doesn't exist
-            if response.status_code == 500:
-                try:
-                    error_data = response.json()
-                    if error_data.get('Message') == 'no result found':
-                        return None
-                except:
-                    pass
+        if stream and (response.status == 404 or 200 <= response.status < 300):
+            # Hand the connection back to the pool without materializing the body
+            response.drain_conn()
+            response.release_conn()
+            return None if response.status == 404 else True
 
-            response.raise_for_status()
+        # Handle different response codes
+        if response.status == 404:
+            return None
 
-            # Return JSON response if available
-            if response.content:
-                return response.json()
+        if response.status == 204:  # No content (successful delete)
             return True
 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}"
+        # Netmaker returns 500 with "no result found" when resource doesn't exist;
+        # a substring check avoids decoding the body on this common path
+        if response.status == 500 and b'"no result found"' in response.data:
+            return None
+
+        if response.status >= 400:
+            error_msg = f"API request failed: {response.status} Error: {response.reason} for url: {url}"
             # Try to include response body if available
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    if 'Message' in error_data:
-                        error_msg += f" - {error_data['Message']}"
-                except:
-                    pass
-            raise Exception(error_msg)
+            error_data = self._error_body(response)
+            if error_data and 'Message' in error_data:
+                error_msg += f" - {error_data['Message']}"
+            raise NetmakerAPIError(error_msg, response.status)
+
+        # Return JSON response if available
+        if self._has_body(response):
+            return _json_loads(response.data)
+        return True
 
     def authenticate(self, username, password):
         """Authenticate with username/password and get token"""
@@ -368,7 +622,9 @@ class NetmakerAPI:
     # Node API methods (for finding ingress gateways)
     def list_nodes(self, network_id):
         """List nodes in a network"""
-        return self._request("GET", f"/nodes/{network_id}")
+        if network_id not in self._nodes_cache:
+            self._nodes_cache[network_id] = self._request("GET", f"/nodes/{network_id}")
+        return self._nodes_cache[network_id]
 
     def find_ingress_gateway(self, network_id):
         """Find first ingress gateway in a network"""
@@ -383,87 +639,179 @@ class NetmakerAPI:
         raise Exception(f"No ingress gateway found in network '{network_id}'")
 
     # External Client API methods
+    def _extclient_cache_path(self, network_id):
+        """Path of the on-disk external client cache for a network"""
+        digest = hashlib.sha1(f"{self.base_url}|{network_id}".encode()).hexdigest()[:16]
+        return os.path.join(os.path.expanduser('~/.ansible/tmp'), f"netmaker_extclients_{digest}.json")
+
+    def _load_extclient_cache(self, network_id):
+        """Load a fresh on-disk external client list, if any"""
+        if not self.extclient_cache_ttl:
+            return None
+
+        path = self._extclient_cache_path(network_id)
+        try:
+            if time.time() - os.path.getmtime(path) > self.extclient_cache_ttl:
+                return None
+            with open(path, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _store_extclient_cache(self, network_id, clients):
+        """Write the external client list to disk for sibling task invocations"""
+        if not self.extclient_cache_ttl:
+            return
+
+        path = self._extclient_cache_path(network_id)
+        tmp_path = f"{path}.{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            # Client data includes WireGuard keys, keep it owner-only
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(clients))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _invalidate_extclient_cache(self, network_id):
+        """Drop cached external clients after a change"""
+        self._extclient_cache.pop(network_id, None)
+        self._extclient_index.pop(network_id, None)
+        try:
+            os.remove(self._extclient_cache_path(network_id))
+        except OSError:
+            pass
+
     def list_extclients(self, network_id):
         """List external clients for a network"""
-        result = self._request("GET", f"/extclients/{network_id}")
-        return result if result else []
+        if network_id in self._extclient_cache:
+            return self._extclient_cache[network_id]
+
+        clients = self._load_extclient_cache(network_id)
+        if clients is None:
+            result = self._request("GET", f"/extclients/{network_id}")
+            clients = result if result else []
+            self._store_extclient_cache(network_id, clients)
+
+        self._extclient_cache[network_id] = clients
+        self._extclient_index[network_id] = {client.get('clientid'): client for client in clients}
+        return clients
+
+    def _prefetch_nodes(self, network_id):
+        """Best-effort node list fetch; failures leave the cache unset"""
+        try:
+            self.list_nodes(network_id)
+        except Exception:
+            # find_ingress_gateway fetches again (and reports errors) if a client is created
+            pass
+
+    def prefetch_extclients_and_nodes(self, network_id):
+        """Fetch the external client and node lists of a network concurrently"""
+        calls = []
+        if network_id not in self._extclient_cache:
+            calls.append(lambda: self.list_extclients(network_id))
+        if network_id not in self._nodes_cache:
+            calls.append(lambda: self._prefetch_nodes(network_id))
+        self._run_concurrently(calls)
 
     def get_extclient(self, network_id, client_id):
         """Get external client by ID"""
-        clients = self.list_extclients(network_id)
-        for client in clients:
-            if client.get('clientid') == client_id:
-                return client
-        return None
+        if network_id not in self._extclient_index:
+            self.list_extclients(network_id)
+        return self._extclient_index[network_id].get(client_id)
 
     def create_extclient(self, network_id, gateway_id, client_data):
         """Create a new external client"""
-        return self._request("POST", f"/extclients/{network_id}/{gateway_id}", client_data)
+        try:
+            return self._request("POST", f"/extclients/{network_id}/{gateway_id}", client_data)
+        finally:
+            # Invalidate afterwards so a sibling process can't re-store the pre-change list
+            self._invalidate_extclient_cache(network_id)
 
     def update_extclient(self, network_id, client_id, client_data):
         """Update an existing external client"""
-        return self._request("PUT", f"/extclients/{network_id}/{client_id}", client_data)
+        try:
+            return self._request("PUT", f"/extclients/{network_id}/{client_id}", client_data)
+        finally:
+            self._invalidate_extclient_cache(network_id)
 
     def delete_extclient(self, network_id, client_id):
         """Delete an external client"""
-        return self._request("DELETE", f"/extclients/{network_id}/{client_id}")
+        try:
+            return self._request("DELETE", f"/extclients/{network_id}/{client_id}")
+        finally:
+            self._invalidate_extclient_cache(network_id)
+
+
+# Fields compared for idempotency (read-only fields are ignored)
+_NET_COMPARE_FIELDS = (
+    'addressrange', 'addressrange6', 'defaultextclientdns',
+    'defaultinterface', 'defaultpostdown', 'defaultpostup',
+    'defaultkeepalive', 'defaultmtu'
+)
+
+_NET_DEFAULTS = {
+    'defaultpostdown': '',
+    'defaultpostup': '',
+}
+
+_EXTCLIENT_COMPARE_FIELDS = ('dns', 'extraallowedips', 'enabled', 'postup', 'postdown')
+
+_EXTCLIENT_LIST_FIELDS = frozenset({'extraallowedips'})
 
 
 def networks_equal(existing, desired):
     """Compare existing network with desired state (ignore read-only fields)"""
-    comparable_fields = [
-        'addressrange', 'addressrange6', 'defaultextclientdns',
-        'defaultinterface', 'defaultpostdown', 'defaultpostup',
-        'defaultkeepalive', 'defaultmtu'
-    ]
-
-    field_defaults = {
-        'defaultpostdown': '',
-        'defaultpostup': '',
-    }
-
-    for field in comparable_fields:
-        if field in desired:
-            if field not in existing and field not in field_defaults:
-                continue
-
-            existing_value = existing.get(field, field_defaults.get(field))
-            desired_value = desired.get(field)
-
-            # Handle boolean to yes/no string conversion
-            if isinstance(desired_value, bool):
-                if existing_value is None:
-                    existing_value = field_defaults.get(field, False)
-                existing_value_bool = existing_value in ['yes', 'true', True, 1]
-                if existing_value_bool != desired_value:
-                    return False
-            # Handle empty string vs None
-            elif desired_value == "" and existing_value in [None, ""]:
-                continue
-            elif existing_value != desired_value:
+    get_existing = existing.get
+    get_default = _NET_DEFAULTS.get
+
+    for field in _NET_COMPARE_FIELDS:
+        if field not in desired:
+            continue
+        if field not in existing and field not in _NET_DEFAULTS:
+            continue
+
+        existing_value = get_existing(field, get_default(field))
+        desired_value = desired[field]
+
+        # Handle boolean to yes/no string conversion
+        if isinstance(desired_value, bool):
+            if existing_value is None:
+                existing_value = get_default(field, False)
+            existing_value_bool = existing_value in ['yes', 'true', True, 1]
+            if existing_value_bool != desired_value:
                 return False
+        # Handle empty string vs None
+        elif desired_value == "" and existing_value in [None, ""]:
+            continue
+        elif existing_value != desired_value:
+            return False
 
     return True
 
 
 def extclients_equal(existing, desired):
     """Compare existing external client with desired state"""
-    comparable_fields = ['dns', 'extraallowedips', 'enabled', 'postup', 'postdown']
-
-    for field in comparable_fields:
-        if field in desired:
-            existing_value = existing.get(field)
-            desired_value = desired.get(field)
-
-            # Handle list comparison
-            if isinstance(desired_value, list):
-                if set(existing_value or []) != set(desired_value or []):
-                    return False
-            # Handle None vs empty string
-            elif desired_value == "" and existing_value in [None, ""]:
-                continue
-            elif existing_value != desired_value:
+    get_existing = existing.get
+
+    for field in _EXTCLIENT_COMPARE_FIELDS:
+        if field not in desired:
+            continue
+
+        existing_value = get_existing(field)
+        desired_value = desired[field]
+
+        # Handle list comparison (order-insensitive, duplicates count)
+        if field in _EXTCLIENT_LIST_FIELDS:
+            if sorted(existing_value or []) != sorted(desired_value or []):
                 return False
+        # Handle None vs empty string
+        elif desired_value == "" and existing_value in [None, ""]:
+            continue
+        elif existing_value != desired_value:
+            return False
 
     return True
 
@@ -527,6 +875,9 @@ def manage_network(module, api, name, state, network_data):
 
 def manage_extclient(module, api, name, network, ingress_gateway_id, state, client_data):
     """Manage external client (device) resources"""
+    if state == 'present' and ingress_gateway_id == 'auto' and not module.check_mode:
+        # Discover gateways alongside the lookup in case the client has to be created
+        api.prefetch_extclients_and_nodes(network)
     existing_client = api.get_extclient(network, name)
 
     result = {
@@ -587,105 +938,135 @@ def manage_extclient(module, api, name, network, ingress_gateway_id, state, clie
     return result
 
 
-def main():
-    # Define network-specific parameters
-    network_params = [
-        'addressrange', 'addressrange6', 'defaultextclientdns',
-        'defaultinterface', 'defaultpostdown', 'defaultpostup',
-        'defaultkeepalive', 'defaultmtu', 'islocal'
-    ]
-
-    # Define external client-specific parameters
-    extclient_params = [
-        'dns', 'extraallowedips', 'enabled', 'postup', 'postdown'
-    ]
+# Network-specific parameters
+_NET_PARAMS = (
+    'addressrange', 'addressrange6', 'defaultextclientdns',
+    'defaultinterface', 'defaultpostdown', 'defaultpostup',
+    'defaultkeepalive', 'defaultmtu', 'islocal'
+)
+
+# External client-specific parameters
+_EXTCLIENT_PARAMS = (
+    'dns', 'extraallowedips', 'enabled', 'postup', 'postdown'
+)
+
+_ARGUMENT_SPEC = dict(
+    resource_type=dict(type='str', required=True, choices=['network', 'extclient']),
+    name=dict(type='str', required=True),
+    network=dict(type='str', required=False),
+    ingress_gateway_id=dict(type='str', required=False, default='auto'),
+    state=dict(type='str', default='present', choices=['present', 'absent']),
+    base_url=dict(type='str', required=True),
+    master_key=dict(type='str', required=False, no_log=True),
+    username=dict(type='str', required=False, default='oriol'),
+    password=dict(type='str', required=False, no_log=True),
+    validate_certs=dict(type='bool', required=False, default=True),
+    # Network-specific options
+    addressrange=dict(type='str', required=False),
+    addressrange6=dict(type='str', required=False),
+    defaultextclientdns=dict(type='str', required=False),
+    defaultinterface=dict(type='str', required=False),
+    defaultpostdown=dict(type='str', required=False),
+    defaultpostup=dict(type='str', required=False),
+    defaultkeepalive=dict(type='int', required=False),
+    defaultmtu=dict(type='int', required=False),
+    islocal=dict(type='bool', required=False, default=False),
+    # External client-specific options
+    dns=dict(type='str', required=False),
+    extraallowedips=dict(type='list', elements='str', required=False),
+    enabled=dict(type='bool', required=False, default=True),
+    postup=dict(type='str', required=False),
+    postdown=dict(type='str', required=False),
+    extclient_cache_ttl=dict(type='int', required=False, default=0),
+    api_timeout=dict(type='float', required=False, default=30),
+    token_cache=dict(type='bool', required=False, default=False),
+)
+
+_REQUIRED_ONE_OF = [
+    ['master_key', 'password']
+]
+
+_REQUIRED_IF = [
+    ['resource_type', 'extclient', ['network']],
+]
 
+
+def main():
     module = AnsibleModule(
-        argument_spec=dict(
-            resource_type=dict(type='str', required=True, choices=['network', 'extclient']),
-            name=dict(type='str', required=True),
-            network=dict(type='str', required=False),
-            ingress_gateway_id=dict(type='str', required=False, default='auto'),
-            state=dict(type='str', default='present', choices=['present', 'absent']),
-            base_url=dict(type='str', required=True),
-            master_key=dict(type='str', required=False, no_log=True),
-            username=dict(type='str', required=False, default='oriol'),
-            password=dict(type='str', required=False, no_log=True),
-            validate_certs=dict(type='bool', required=False, default=True),
-            # Network-specific options
-            addressrange=dict(type='str', required=False),
-            addressrange6=dict(type='str', required=False),
-            defaultextclientdns=dict(type='str', required=False),
-            defaultinterface=dict(type='str', required=False),
-            defaultpostdown=dict(type='str', required=False),
-            defaultpostup=dict(type='str', required=False),
-            defaultkeepalive=dict(type='int', required=False),
-            defaultmtu=dict(type='int', required=False),
-            islocal=dict(type='bool', required=False, default=False),
-            # External client-specific options
-            dns=dict(type='str', required=False),
-            extraallowedips=dict(type='list', elements='str', required=False),
-            enabled=dict(type='bool', required=False, default=True),
-            postup=dict(type='str', required=False),
-            postdown=dict(type='str', required=False),
-        ),
-        required_one_of=[
-            ['master_key', 'password']
-        ],
-        required_if=[
-            ['resource_type', 'extclient', ['network']],
-        ],
+        argument_spec=_ARGUMENT_SPEC,
+        required_one_of=_REQUIRED_ONE_OF,
+        required_if=_REQUIRED_IF,
         supports_check_mode=True
     )
 
-    if not HAS_REQUESTS:
-        module.fail_json(msg=missing_required_lib('requests'), exception=REQUESTS_IMPORT_ERROR)
+    if not HAS_URLLIB3:
+        module.fail_json(msg=missing_required_lib('urllib3'), exception=URLLIB3_IMPORT_ERROR)
 
     # Get parameters
-    resource_type = module.params['resource_type']
-    name = module.params['name']
-    network = module.params.get('network')
-    ingress_gateway_id = module.params.get('ingress_gateway_id')
-    state = module.params['state']
-    base_url = module.params['base_url']
-    master_key = module.params.get('master_key')
-    username = module.params.get('username')
-    password = module.params.get('password')
-    validate_certs = module.params['validate_certs']
-
+    params = module.params
+    resource_type = params['resource_type']
+    name = params['name']
+    network = params.get('network')
+    ingress_gateway_id = params.get('ingress_gateway_id')
+    state = params['state']
+    base_url = params['base_url']
+    master_key = params.get('master_key')
+    username = params.get('username')
+    password = params.get('password')
+    validate_certs = params['validate_certs']
+    extclient_cache_ttl = params['extclient_cache_ttl']
+    api_timeout = params['api_timeout']
+    token_cache = params['token_cache']
+
+    if api_timeout <= 0:
+        module.fail_json(msg=f"api_timeout must be greater than 0, got {api_timeout}")
+
+    api = None
+    cached_token = None
+    if not master_key and token_cache:
+        cached_token = _load_cached_token(base_url, username, password)
+    token_from_cache = cached_token is not None
     try:
-        # Initialize API client
-        if master_key:
-            token = master_key
-        else:
-            # Authenticate to get token
-            temp_api = NetmakerAPI(base_url, "", validate_certs)
-            token = temp_api.authenticate(username, password)
-
-        api = NetmakerAPI(base_url, token, validate_certs)
+        # Initialize the only API client; its connection pool also serves authentication
+        api = NetmakerAPI(
+            base_url, master_key or cached_token or "", validate_certs, extclient_cache_ttl,
+            timeout=(min(3.05, api_timeout), api_timeout)
+        )
+        if not api.token:
+            if token_cache:
+                api.set_token(_authenticate_and_cache(api, base_url, username, password))
+            else:
+                api.set_token(api.authenticate(username, password))
 
         # Handle different resource types
         if resource_type == 'network':
             # Build network data from parameters
-            network_data = {'netid': name}
-            for param in network_params:
-                if module.params.get(param) is not None:
-                    network_data[param] = module.params[param]
+            network_data = {'netid': name, **{k: params[k] for k in _NET_PARAMS if params[k] is not None}}
 
-            result = manage_network(module, api, name, state, network_data)
+            manage = partial(manage_network, module, api, name, state, network_data)
 
         elif resource_type == 'extclient':
             # Build external client data from parameters
-            client_data = {'clientid': name}
-            for param in extclient_params:
-                if module.params.get(param) is not None:
-                    client_data[param] = module.params[param]
+            client_data = {'clientid': name, **{k: params[k] for k in _EXTCLIENT_PARAMS if params[k] is not None}}
 
-            result = manage_extclient(module, api, name, network, ingress_gateway_id, state, client_data)
+            manage = partial(manage_extclient, module, api, name, network, ingress_gateway_id, state, client_data)
 
+        try:
+            result = manage()
+        except NetmakerAPIError as e:
+            if not token_from_cache or e.status not in (401, 403):
+                raise
+            # The cached token was rejected (e.g. revoked); authenticate afresh and retry once
+            token_from_cache = False
+            api.set_token(_authenticate_and_cache(api, base_url, username, password))
+            result = manage()
+
+        api.close()
         module.exit_json(**result)
 
     except Exception as e:
+        if api is not None:
+            api.close()
         module.fail_json(msg=f"Error managing Netmaker {resource_type}: {str(e)}")
 
 